@@ -4,9 +4,11 @@ Provides simpler methods for :class:`~.cloud_wanderer.CloudWanderer` to call.
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, cast
+import threading
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, cast
 
 import botocore
+import botocore.config
 
 from ..base import CloudInterface, ServiceResourceTypeFilter
 from ..cloud_wanderer_resource import CloudWandererResource
@@ -23,6 +25,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_NO_CLIENT_ARGS: FrozenSet[Tuple[str, Any]] = frozenset()
+
 
 def _get_service_resource_type_filter_from_list(
     service_resource_type_filters: List[AWSResourceTypeFilter], service: str, resource_type: str
@@ -40,14 +44,27 @@ def _get_service_resource_type_filter_from_list(
 class CloudWandererAWSInterface(CloudInterface):
     """Simplifies lookup of Boto3 services and resources."""
 
-    def __init__(self, cloudwanderer_boto3_session: Optional[CloudWandererBoto3Session] = None) -> None:
+    def __init__(
+        self,
+        cloudwanderer_boto3_session: Optional[CloudWandererBoto3Session] = None,
+        botocore_config: Optional[botocore.config.Config] = None,
+    ) -> None:
         """Simplifies lookup of Boto3 services and resources.
 
         Arguments:
             cloudwanderer_boto3_session:
                 A CloudWandererBoto3Session session, if not provided the default will be used.
+            botocore_config:
+                The botocore config to create clients with, any ``config`` passed in ``client_args`` is merged
+                over it. Defaults to a connection pool of 50 and adaptive retries of up to 10 attempts
+                so that concurrent discovery backs off when throttled rather than failing.
         """
         self.cloudwanderer_boto3_session = cloudwanderer_boto3_session or CloudWandererBoto3Session()
+        self.botocore_config = botocore_config or botocore.config.Config(
+            max_pool_connections=50, retries={"mode": "adaptive", "max_attempts": 10}
+        )
+        # Released along with the thread so that short lived worker threads don't keep their clients alive.
+        self._thread_services = threading.local()
 
     def get_enabled_regions(self) -> List[str]:
         """Return the list of regions enabled.
@@ -60,6 +77,48 @@ class CloudWandererAWSInterface(CloudInterface):
         """Return the ID of the account we're getting resources from."""
         return self.cloudwanderer_boto3_session.get_account_id()
 
+    def _get_service(
+        self, service_name: str, region_name: Optional[str] = None, client_args: Optional[Dict[str, Any]] = None
+    ) -> "CloudWandererServiceResource":
+        """Return a service resource, reusing the one previously created by this thread for these args.
+
+        Creating a service resource loads its JSON models and resolves its endpoint, so is expensive.
+        Service resources are not thread safe so each thread gets its own.
+
+        Arguments:
+            service_name: The name of the service to get (e.g. ``'ec2'``)
+            region_name: The region to get the service in (e.g. ``'eu-west-1'``)
+            client_args: Additional keyword arguments will be passed down to the Boto3 client.
+        """
+        if not client_args:
+            frozen_client_args = _NO_CLIENT_ARGS
+        else:
+            try:
+                frozen_client_args = frozenset(client_args.items())
+            except TypeError:
+                return self._create_service(service_name=service_name, region_name=region_name, client_args=client_args)
+        services = getattr(self._thread_services, "services", None)
+        if services is None:
+            services = self._thread_services.services = {}
+        cache_key = (service_name, region_name, frozen_client_args)
+        if cache_key not in services:
+            services[cache_key] = self._create_service(
+                service_name=service_name, region_name=region_name, client_args=dict(frozen_client_args)
+            )
+        return services[cache_key]
+
+    def _create_service(
+        self, service_name: str, region_name: Optional[str], client_args: Dict[str, Any]
+    ) -> "CloudWandererServiceResource":
+        config = self.botocore_config
+        if client_args.get("config"):
+            config = config.merge(client_args["config"])
+        return self.cloudwanderer_boto3_session.resource(
+            service_name=cast(AWS_SERVICES, service_name),
+            region_name=region_name,
+            **{**client_args, "config": config},
+        )
+
     def get_resource(
         self,
         urn: URN,
@@ -81,17 +140,15 @@ class CloudWandererAWSInterface(CloudInterface):
         """
         validated_resource_type_filters = self._type_check_filter_objects(service_resource_type_filters or {})
         try:
-            service = self.cloudwanderer_boto3_session.resource(
-                service_name=cast(AWS_SERVICES, urn.service), region_name=urn.region, **(client_args or {})
-            )
+            service = self._get_service(service_name=urn.service, region_name=urn.region, client_args=client_args)
             if service.service_map.is_global_service and service.service_map.global_service_region != urn.region:
                 logger.info(
                     "Creating service in %s instead of the resource's %s region because the service has a global API",
                     service.service_map.global_service_region,
                     urn.region,
                 )
-                service = self.cloudwanderer_boto3_session.resource(
-                    service_name=cast(AWS_SERVICES, urn.service), region_name=service.service_map.global_service_region
+                service = self._get_service(
+                    service_name=urn.service, region_name=service.service_map.global_service_region
                 )
             resource = service.resource(resource_type=urn.resource_type, identifiers=urn.resource_id_parts)
             if resource.resource_map.type == ResourceIndependenceType.DEPENDENT_RESOURCE:
@@ -117,14 +174,17 @@ class CloudWandererAWSInterface(CloudInterface):
             logger.warning("Found no data for %s", urn)
             return None
 
+        resource_urn = resource.get_urn()
         dependent_resource_urns = []
         if include_dependent_resources:
-            for dependent_resource in self._get_dependent_resources(resource, validated_resource_type_filters):
+            for dependent_resource in self._get_dependent_resources(
+                resource, resource_urn, validated_resource_type_filters
+            ):
                 dependent_resource_urns.append(dependent_resource.urn)
                 yield dependent_resource
 
         yield CloudWandererResource(
-            urn=resource.get_urn(),
+            urn=resource_urn,
             resource_data=resource.normalized_raw_data,
             dependent_resource_urns=dependent_resource_urns,
             relationships=resource.relationships,
@@ -153,9 +213,7 @@ class CloudWandererAWSInterface(CloudInterface):
         validated_resource_type_filters = self._type_check_filter_objects(service_resource_type_filters or {})
         service_name = cast(AWS_SERVICES, service_name)
         logger.info("Getting %s %s resources from %s", service_name, resource_type, region)
-        service = self.cloudwanderer_boto3_session.resource(
-            service_name=service_name, region_name=region, **(client_args or {})
-        )
+        service = self._get_service(service_name=service_name, region_name=region, client_args=client_args)
         resource_map: ResourceMap = service.service_map.get_resource_map(resource_type)
         base_resource_filter = (
             _get_service_resource_type_filter_from_list(
@@ -176,14 +234,17 @@ class CloudWandererAWSInterface(CloudInterface):
                         resource,
                     )
                     continue
+                if resource.resource_map.requires_load:
+                    resource.load()
+                resource_urn = resource.get_urn()
                 dependent_resource_urns = []
-                for dependent_resource in self._get_dependent_resources(resource, validated_resource_type_filters):
+                for dependent_resource in self._get_dependent_resources(
+                    resource, resource_urn, validated_resource_type_filters
+                ):
                     dependent_resource_urns.append(dependent_resource.urn)
                     yield dependent_resource
-                if resource.resource_map.requires_load:
-                    resource.load()
                 yield CloudWandererResource(
-                    urn=resource.get_urn(),
+                    urn=resource_urn,
                     resource_data=resource.normalized_raw_data,
                     dependent_resource_urns=dependent_resource_urns,
                     relationships=resource.relationships,
@@ -200,6 +261,7 @@ class CloudWandererAWSInterface(CloudInterface):
     def _get_dependent_resources(
         self,
         resource: "CloudWandererServiceResource",
+        resource_urn: URN,
         service_resource_type_filters: Optional[List[AWSResourceTypeFilter]],
     ) -> Iterator[CloudWandererResource]:
         for dependent_resource_type in resource.dependent_resource_types:
@@ -207,8 +269,8 @@ class CloudWandererAWSInterface(CloudInterface):
                 "Getting %s %s dependent resources from %s for %s",
                 resource.service_name,
                 dependent_resource_type,
-                resource.get_region(),
-                resource.get_urn().resource_id,
+                resource_urn.region,
+                resource_urn.resource_id,
             )
             dependent_resource_map = resource.service_map.get_resource_map(dependent_resource_type)
             dependent_resource_filter = (
@@ -244,7 +306,7 @@ class CloudWandererAWSInterface(CloudInterface):
                 yield CloudWandererResource(
                     urn=urn,
                     resource_data=dependent_resource.normalized_raw_data,
-                    parent_urn=resource.get_urn(),
+                    parent_urn=resource_urn,
                     relationships=dependent_resource.relationships,
                 )
 
@@ -271,7 +333,7 @@ class CloudWandererAWSInterface(CloudInterface):
                 for resource_type in service_resource_types
                 if resource_type.service == service_name
             ]
-            service = self.cloudwanderer_boto3_session.resource(service_name=cast(AWS_SERVICES, service_name))
+            service = self._get_service(service_name=service_name)
             action_sets.extend(
                 self._get_discovery_action_templates_for_service(
                     service=service, resource_types=service_specific_resource_types, discovery_regions=discovery_regions
@@ -1,17 +1,19 @@
 """Create the CloudWandererServiceResource objects that do the magic."""
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
 
 import jmespath  # type: ignore
 from boto3.resources.base import ServiceResource
 from boto3.resources.collection import CollectionManager
 from boto3.resources.factory import ResourceFactory
-from boto3.resources.model import Collection
+from boto3.resources.model import Collection, ResourceModel
 from boto3.resources.params import create_request_parameters
 from botocore import xform_name
 from botocore.loaders import Loader
 from botocore.model import Shape
 
+from ..cache_helpers import cached_property
 from ..exceptions import UnsupportedResourceTypeError
 from ..models import (
     Relationship,
@@ -38,6 +40,14 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _load_secondary_attribute(
+    secondary_attribute_resource: "CloudWandererServiceResource",
+) -> "CloudWandererServiceResource":
+    secondary_attribute_resource.load()
+    secondary_attribute_resource.fetch_secondary_attributes()
+    return secondary_attribute_resource
+
+
 class CloudWandererResourceFactory(ResourceFactory):
     """Enriches functionality of boto3 resource objects with CloudWanderer specific methods."""
 
@@ -50,8 +60,19 @@ class CloudWandererResourceFactory(ResourceFactory):
         super().__init__(emitter=emitter)
         self.service_mapping_loader = service_mapping_loader or MergedServiceLoader()
         self.cloudwanderer_boto3_session = cloudwanderer_boto3_session
+        self._class_definitions: Dict[Tuple[str, str, str], type] = {}
 
     def load_from_definition(self, resource_name, single_resource_json_definition, service_context) -> type:
+        # Boto3 calls this for every page of a collection and every subresource it creates, but the class
+        # only depends on the service model and resource name so we only build it once.
+        cache_key = (service_context.service_name, service_context.service_model.api_version, resource_name)
+        if cache_key not in self._class_definitions:
+            self._class_definitions[cache_key] = self._load_from_definition(
+                resource_name, single_resource_json_definition, service_context
+            )
+        return self._class_definitions[cache_key]
+
+    def _load_from_definition(self, resource_name, single_resource_json_definition, service_context) -> type:
         class_definition = super().load_from_definition(resource_name, single_resource_json_definition, service_context)
         attrs: Dict[str, Any] = {}
         # CloudWanderer resource methods
@@ -67,10 +88,14 @@ class CloudWandererResourceFactory(ResourceFactory):
             attrs=attrs,
             resource_name=resource_name,
             service_context=service_context,
+            original_class_definition=class_definition,
         )
 
         for attribute_name, attribute_value in attrs.items():
             setattr(class_definition, attribute_name, attribute_value)
+            # setattr does not notify descriptors of their name the way class creation does.
+            if hasattr(attribute_value, "__set_name__"):
+                attribute_value.__set_name__(class_definition, attribute_name)
         return class_definition
 
     def _load_cloudwanderer_methods(
@@ -291,8 +316,7 @@ class CloudWandererResourceFactory(ResourceFactory):
 
     def _create_fetch_secondary_attributes(self) -> Callable:
         def fetch_secondary_attributes(self) -> None:
-            self._secondary_attributes = []
-
+            secondary_attribute_resources = []
             for secondary_attribute_name in self.secondary_attribute_names:
                 logger.info(
                     "Getting %s secondary attributes from %s for %s",
@@ -301,26 +325,32 @@ class CloudWandererResourceFactory(ResourceFactory):
                     self.get_urn().resource_id,
                 )
                 getter = getattr(self, snake_to_pascal(secondary_attribute_name))
-                secondary_attribute_resource = getter()
-                secondary_attribute_resource.load()
-                secondary_attribute_resource.fetch_secondary_attributes()
-                self._secondary_attributes.append(secondary_attribute_resource)
+                secondary_attribute_resources.append(getter())
+
+            if len(secondary_attribute_resources) > 1:
+                # Each load is a separate API call so make them at the same time.
+                with ThreadPoolExecutor(max_workers=len(secondary_attribute_resources)) as executor:
+                    self._secondary_attributes = list(
+                        executor.map(_load_secondary_attribute, secondary_attribute_resources)
+                    )
+            else:
+                self._secondary_attributes = [
+                    _load_secondary_attribute(secondary_attribute_resource)
+                    for secondary_attribute_resource in secondary_attribute_resources
+                ]
             self._secondary_attributes_fetched = True
 
         return fetch_secondary_attributes
 
-    def _create_secondary_attribute_names(self) -> property:
-        def secondary_attribute_names(self) -> List[str]:
-            secondary_attribute_names = []
-            for subresource in self.meta.resource_model.subresources:
-                resource_map = self.service_map.get_resource_map(xform_name(subresource.name))
-                if not resource_map or resource_map.type != ResourceIndependenceType.SECONDARY_ATTRIBUTE:
-                    continue
-                secondary_attribute_names.append(xform_name(subresource.name))
-
-            return secondary_attribute_names
+    def _get_secondary_attribute_names(self, resource_model: ResourceModel, service_map: ServiceMap) -> List[str]:
+        secondary_attribute_names = []
+        for subresource in resource_model.subresources:
+            resource_map = service_map.get_resource_map(xform_name(subresource.name))
+            if not resource_map or resource_map.type != ResourceIndependenceType.SECONDARY_ATTRIBUTE:
+                continue
+            secondary_attribute_names.append(xform_name(subresource.name))
 
-        return property(secondary_attribute_names)
+        return secondary_attribute_names
 
     def _create_get_account_id(self) -> Callable:
         def get_account_id(self) -> str:
@@ -354,7 +384,7 @@ class CloudWandererResourceFactory(ResourceFactory):
 
         return property(normalized_raw_data)
 
-    def _create_resource_types(self) -> property:
+    def _create_resource_types(self) -> cached_property:
         def resource_types(self) -> List[str]:
             """List resources which are directly enumerable from the service."""
             resource_types = [
@@ -363,27 +393,24 @@ class CloudWandererResourceFactory(ResourceFactory):
 
             return resource_types
 
-        return property(resource_types)
-
-    def _create_dependent_resource_types(self) -> property:
-        def dependent_resource_types(self) -> List[str]:
-            dependent_resource_types = set()
-            for collection in self.meta.resource_model.collections:
-                resource_type = xform_name(collection.resource.type)
-                resource_map = self.service_map.get_resource_map(resource_type=resource_type)
-                if resource_map.type == ResourceIndependenceType.DEPENDENT_RESOURCE:
-                    dependent_resource_types.add(resource_type)
-            for subresource in self.meta.resource_model.subresources + self.meta.resource_model.references:
-                resource_type = xform_name(subresource.resource.type)
-                if resource_type in dependent_resource_types:
-                    continue
-                resource_map = self.service_map.get_resource_map(resource_type=resource_type)
-                if resource_map.type == ResourceIndependenceType.DEPENDENT_RESOURCE:
-                    dependent_resource_types.add(resource_type)
-
-            return sorted(list(dependent_resource_types))
-
-        return property(dependent_resource_types)
+        return cached_property(resource_types)
+
+    def _get_dependent_resource_types(self, resource_model: ResourceModel, service_map: ServiceMap) -> List[str]:
+        dependent_resource_types = set()
+        for collection in resource_model.collections:
+            resource_type = xform_name(collection.resource.type)
+            resource_map = service_map.get_resource_map(resource_type=resource_type)
+            if resource_map.type == ResourceIndependenceType.DEPENDENT_RESOURCE:
+                dependent_resource_types.add(resource_type)
+        for subresource in resource_model.subresources + resource_model.references:
+            resource_type = xform_name(subresource.resource.type)
+            if resource_type in dependent_resource_types:
+                continue
+            resource_map = service_map.get_resource_map(resource_type=resource_type)
+            if resource_map.type == ResourceIndependenceType.DEPENDENT_RESOURCE:
+                dependent_resource_types.add(resource_type)
+
+        return sorted(list(dependent_resource_types))
 
     def _create_shape(self) -> property:
         def shape(self) -> Shape:
@@ -442,7 +469,11 @@ class CloudWandererResourceFactory(ResourceFactory):
         return property(is_dependent_resource)
 
     def _load_cloudwanderer_properties(
-        self, attrs: Dict[str, Any], resource_name: str, service_context: "ServiceContext"
+        self,
+        attrs: Dict[str, Any],
+        resource_name: str,
+        service_context: "ServiceContext",
+        original_class_definition: Type[ServiceResource],
     ) -> None:
         attrs["service_name"] = service_context.service_name
         attrs["service_map"] = ServiceMap.factory(
@@ -458,11 +489,17 @@ class CloudWandererResourceFactory(ResourceFactory):
             attrs["resource_types"] = self._create_resource_types()
         else:
             # If it is a resource:
+            # These only depend on the resource model so we resolve them once for the class not for every resource.
+            resource_model = original_class_definition.meta.resource_model
             attrs["normalized_raw_data"] = self._create_normalized_raw_data()
             attrs["resource_type"] = xform_name(resource_name)
-            attrs["resource_map"] = attrs["service_map"].get_resource_map(resource_type=xform_name(resource_name))
-            attrs["dependent_resource_types"] = self._create_dependent_resource_types()
-            attrs["secondary_attribute_names"] = self._create_secondary_attribute_names()
+            attrs["resource_map"] = attrs["service_map"].get_resource_map(resource_type=attrs["resource_type"])
+            attrs["dependent_resource_types"] = self._get_dependent_resource_types(
+                resource_model=resource_model, service_map=attrs["service_map"]
+            )
+            attrs["secondary_attribute_names"] = self._get_secondary_attribute_names(
+                resource_model=resource_model, service_map=attrs["service_map"]
+            )
             attrs["shape"] = self._create_shape()
             attrs["relationships"] = self._create_relationships()
             attrs["is_dependent_resource"] = self._create_is_dependent_resource()
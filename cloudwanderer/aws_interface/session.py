@@ -1,5 +1,6 @@
 """Subclass of Boto3 Session class to provide additional helper methods."""
 import logging
+import threading
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import boto3
@@ -113,6 +114,8 @@ class CloudWandererBoto3Session(boto3.session.Session):
         self.getter_client_config = getter_client_config or CloudWandererBoto3ClientConfig()
         self._account_id = account_id
         self._enabled_regions = enabled_regions
+        # Sessions are not thread safe and nor are the resources they create, only their clients are.
+        self._lock = threading.RLock()
 
     @memoized_method()
     def get_account_id(self) -> str:
@@ -134,6 +137,11 @@ class CloudWandererBoto3Session(boto3.session.Session):
         regions = self.client("ec2", **self.getter_client_config("ec2")).describe_regions()["Regions"]
         return [region["RegionName"] for region in regions if region["OptInStatus"] != "not-opted-in"]
 
+    @memoized_method()
+    def get_available_resources(self) -> List[str]:
+        """Return a list of the services which have resource models available."""
+        return super().get_available_resources()
+
     def resource(  # type: ignore[override]
         self,
         service_name: AWS_SERVICES,
@@ -147,15 +155,43 @@ class CloudWandererBoto3Session(boto3.session.Session):
         aws_session_token: Optional[str] = None,
         config: Optional[botocore.client.Config] = None,
     ) -> "CloudWandererServiceResource":
-        return super().resource(  # type: ignore[call-overload, misc]
-            service_name,  # type: ignore[arg-type]
-            region_name=region_name,
-            api_version=api_version,
-            use_ssl=use_ssl,
-            verify=verify,
-            endpoint_url=endpoint_url,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            aws_session_token=aws_session_token,
-            config=config,
-        )
+        with self._lock:
+            return super().resource(  # type: ignore[call-overload, misc]
+                service_name,  # type: ignore[arg-type]
+                region_name=region_name,
+                api_version=api_version,
+                use_ssl=use_ssl,
+                verify=verify,
+                endpoint_url=endpoint_url,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                aws_session_token=aws_session_token,
+                config=config,
+            )
+
+    def client(  # type: ignore[override]
+        self,
+        service_name: str,
+        region_name: Optional[str] = None,
+        api_version: Optional[str] = None,
+        use_ssl: Optional[bool] = True,
+        verify: Union[bool, str, None] = None,
+        endpoint_url: Optional[str] = None,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        aws_session_token: Optional[str] = None,
+        config: Optional[botocore.client.Config] = None,
+    ) -> botocore.client.BaseClient:
+        with self._lock:
+            return super().client(
+                service_name,
+                region_name=region_name,
+                api_version=api_version,
+                use_ssl=use_ssl,
+                verify=verify,
+                endpoint_url=endpoint_url,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                aws_session_token=aws_session_token,
+                config=config,
+            )
@@ -45,6 +45,9 @@ class CloudInterface(abc.ABC):
     ) -> Iterator[CloudWandererResource]:
         """Return all resources of resource_type from Boto3.
 
+        :meth:`cloudwanderer.cloud_wanderer.CloudWanderer.write_resources` calls this from several threads at
+        once so implementations must be thread safe.
+
         Arguments:
             service_name (str): The name of the service to get resource for (e.g. ``'ec2'``)
             resource_type (str): The type of resource to get resources of (e.g. ``'instance'``)
@@ -1,19 +1,27 @@
 """Main cloudwanderer module."""
 import concurrent.futures
+import functools
 import logging
+import queue
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Callable, Dict, List, NamedTuple, Optional, Union
+from typing import Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union, cast
 
 from .aws_interface import CloudWandererAWSInterface
 from .base import CloudInterface, ServiceResourceTypeFilter
 from .cloud_wanderer_resource import CloudWandererResource
-from .models import ServiceResourceType
+from .models import ActionSet, ServiceResourceType
 from .storage_connectors import BaseStorageConnector
 from .urn import URN, PartialUrn
 from .utils import exception_logging_wrapper
 
 logger = logging.getLogger("cloudwanderer")
 
+_RESOURCE_QUEUE_SIZE = 1000
+_WRITE_BATCH_SIZE = 25
+_Fetch = Tuple[concurrent.futures.Future, "_ResourceQueue"]
+
 
 class CloudWanderer:
     """CloudWanderer."""
@@ -63,29 +71,38 @@ class CloudWanderer:
         """
         for storage_connector in self.storage_connectors:
             storage_connector.open()
-        resources = list(
-            self.cloud_interface.get_resource(urn=urn, service_resource_type_filters=service_resource_type_filters)
-        )
-
-        for resource in resources:
-            self._write_resource(resource=resource)
-        if not resources:
+        try:
+            resource_found = False
+            for resource in self.cloud_interface.get_resource(
+                urn=urn, service_resource_type_filters=service_resource_type_filters
+            ):
+                resource_found = True
+                self._write_resource(resource=resource)
+            if not resource_found:
+                for storage_connector in self.storage_connectors:
+                    storage_connector.delete_resource(urn)
+        finally:
+            # Connectors may buffer writes until they are closed, so close them even if the pass failed.
             for storage_connector in self.storage_connectors:
-                storage_connector.delete_resource(urn)
-
-        for storage_connector in self.storage_connectors:
-            storage_connector.close()
+                storage_connector.close()
 
     def write_resources(
         self,
         regions: Optional[List[str]] = None,
         service_resource_types: Optional[List[ServiceResourceType]] = None,
         service_resource_type_filters: Optional[List[ServiceResourceTypeFilter]] = None,
+        concurrency: int = 10,
     ) -> None:
         """Fetch all resources in this account from all regions and all services and write to storage.
 
         All arguments are optional.
 
+        Resources are fetched from the cloud interface by up to ``concurrency`` threads at once
+        (one per service, resource type and region), while writes to the storage connectors happen on the calling
+        thread so the connectors do **not** need to be thread safe. Fetched resources are handed to the calling
+        thread through bounded queues and written in batches as they arrive.
+        The cloud interface's ``get_resources`` is called from several threads at once so it **must** be thread safe.
+
         Example:
             Fetch AWS EC2 VPCs and write to a local Gremlin database.
 
@@ -108,52 +125,129 @@ class CloudWanderer:
             service_resource_type_filters:
                 List of :class:`~cloudwanderer.base.ServiceResourceTypeFilter`
                 specific to the CloudInterface that helps filter resources.
+            concurrency:
+                Number of threads to fetch resources from the cloud interface with.
+                Use ``1`` if the cloud interface is not thread safe.
 
         Raises:
             ValueError: If invalid get/delete urns are produced by the cloud interface's get_resource_discovery_actions
         """
         for storage_connector in self.storage_connectors:
             storage_connector.open()
-        action_sets = self.cloud_interface.get_resource_discovery_actions(
-            regions=regions, service_resource_types=service_resource_types
-        )
-        discovery_start_times: Dict[str, datetime] = {}
-        for action_set in action_sets:
-            for get_urn in action_set.get_urns:
-                if not get_urn.region or not get_urn.service or not get_urn.resource_type:
-                    raise ValueError(f"Invalid get_urn {get_urn}")
-
-                resources = self.cloud_interface.get_resources(
-                    region=get_urn.region,
-                    service_name=get_urn.service,
-                    resource_type=get_urn.resource_type,
-                    service_resource_type_filters=service_resource_type_filters or [],
+        cancelled = threading.Event()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            action_sets = self.cloud_interface.get_resource_discovery_actions(
+                regions=regions, service_resource_types=service_resource_types
+            )
+            discovery_start_times: Dict[str, datetime] = {}
+            # Fetch ahead of the action set being written, but write and clean up in order as the cleanup
+            # cutoffs of dependent resource types rely on their parent's action set having been written.
+            queued_action_sets: Deque[Tuple[ActionSet, List[_Fetch]]] = deque()
+            for action_set in action_sets:
+                for get_urn in action_set.get_urns:
+                    if not get_urn.region or not get_urn.service or not get_urn.resource_type:
+                        raise ValueError(f"Invalid get_urn {get_urn}")
+                queued_action_sets.append(
+                    (
+                        action_set,
+                        self._submit_get_resources(
+                            executor=executor,
+                            action_set=action_set,
+                            service_resource_type_filters=service_resource_type_filters or [],
+                            cancelled=cancelled,
+                        ),
+                    )
                 )
+                if len(queued_action_sets) > concurrency:
+                    self._write_action_set(*queued_action_sets.popleft(), discovery_start_times=discovery_start_times)
+            while queued_action_sets:
+                self._write_action_set(*queued_action_sets.popleft(), discovery_start_times=discovery_start_times)
+        finally:
+            # If we stopped early, stop any fetches waiting for us to empty their queues so the executor can exit.
+            cancelled.set()
+            executor.shutdown()
+            # Connectors may buffer writes until they are closed, so close them even if the pass failed.
+            for storage_connector in self.storage_connectors:
+                storage_connector.close()
+
+    def _submit_get_resources(
+        self,
+        executor: concurrent.futures.Executor,
+        action_set: ActionSet,
+        service_resource_type_filters: List[ServiceResourceTypeFilter],
+        cancelled: threading.Event,
+    ) -> List[_Fetch]:
+        fetches = []
+        for get_urn in action_set.get_urns:
+            resource_queue = _ResourceQueue(maxsize=_RESOURCE_QUEUE_SIZE, cancelled=cancelled)
+            future = executor.submit(
+                self._get_resources,
+                get_urn=get_urn,
+                service_resource_type_filters=service_resource_type_filters,
+                resource_queue=resource_queue,
+            )
+            fetches.append((future, resource_queue))
+        return fetches
+
+    def _write_action_set(
+        self,
+        action_set: ActionSet,
+        fetches: List[_Fetch],
+        discovery_start_times: Dict[str, datetime],
+    ) -> None:
+        for future, resource_queue in fetches:
+            for resources in resource_queue.batches(batch_size=_WRITE_BATCH_SIZE):
                 for resource in resources:
-                    earliest_resource_discovered = discovery_start_times.get(resource.urn.cloud_service_resource_label)
+                    label = resource.urn.cloud_service_resource_label
+                    earliest_resource_discovered = discovery_start_times.get(label)
                     if not earliest_resource_discovered or resource.discovery_time < earliest_resource_discovered:
-                        discovery_start_times[resource.urn.cloud_service_resource_label] = resource.discovery_time
-                    self._write_resource(resource)
-            for delete_urn in action_set.delete_urns:
-                if (
-                    not delete_urn.account_id
-                    or not delete_urn.region
-                    or not delete_urn.service
-                    or not delete_urn.resource_type
-                    or not delete_urn.cloud_name
-                ):
-                    raise ValueError(f"Invalid delete_urn {delete_urn}")
-                for storage_connector in self.storage_connectors:
-                    storage_connector.delete_resource_of_type_in_account_region(
-                        cloud_name=delete_urn.cloud_name,
-                        account_id=delete_urn.account_id,
-                        region=delete_urn.region,
-                        service=delete_urn.service,
-                        resource_type=delete_urn.resource_type,
-                        cutoff=discovery_start_times.get(delete_urn.cloud_service_resource_label),
-                    )
-        for storage_connector in self.storage_connectors:
-            storage_connector.close()
+                        discovery_start_times[label] = resource.discovery_time
+                self._write_resources(resources)
+            # Raise any exception the fetch ended with.
+            future.result()
+        self._delete_resources(action_set=action_set, discovery_start_times=discovery_start_times)
+
+    def _get_resources(
+        self,
+        get_urn: PartialUrn,
+        service_resource_type_filters: List[ServiceResourceTypeFilter],
+        resource_queue: "_ResourceQueue",
+    ) -> None:
+        if resource_queue.cancelled:
+            # The write failed before this fetch started, don't make any calls for resources nobody will write.
+            return
+        try:
+            for resource in self.cloud_interface.get_resources(
+                region=cast(str, get_urn.region),
+                service_name=cast(str, get_urn.service),
+                resource_type=cast(str, get_urn.resource_type),
+                service_resource_type_filters=service_resource_type_filters,
+            ):
+                if not resource_queue.put(resource):
+                    return
+        finally:
+            resource_queue.put(None)
+
+    def _delete_resources(self, action_set: ActionSet, discovery_start_times: Dict[str, datetime]) -> None:
+        for delete_urn in action_set.delete_urns:
+            if (
+                not delete_urn.account_id
+                or not delete_urn.region
+                or not delete_urn.service
+                or not delete_urn.resource_type
+                or not delete_urn.cloud_name
+            ):
+                raise ValueError(f"Invalid delete_urn {delete_urn}")
+            for storage_connector in self.storage_connectors:
+                storage_connector.delete_resource_of_type_in_account_region(
+                    cloud_name=delete_urn.cloud_name,
+                    account_id=delete_urn.account_id,
+                    region=delete_urn.region,
+                    service=delete_urn.service,
+                    resource_type=delete_urn.resource_type,
+                    cutoff=discovery_start_times.get(delete_urn.cloud_service_resource_label),
+                )
 
     def write_resources_concurrently(
         self,
@@ -170,47 +264,129 @@ class CloudWanderer:
         Arguments:
             concurrency (int):
                 Number of query threads to invoke concurrently.
+                Each thread writes one region at a time and fetches its resources one resource type at a time.
             cloud_interface_generator (Callable):
                  A method which returns a new cloud interface session when called.
                 This helps prevent non-threadsafe cloud interfaces from interfering with each others.
+                It is called once per worker thread and the interface is not shared with other workers.
             storage_connector_generator (Callable):
                 A method which returns a list of storage connectors when called.
                 The returned connectors should be instances of the same connectors each time the method is called.
                 These connectors do **not** need to be thread safe and will be returned at the end of execution.
+                It is called once per worker thread and the connectors are reused for every region that thread writes.
             **kwargs:
                 Additional keyword arguments will be passed down to the cloud interface methods.
         """
         logger.info("Writing resources in all regions")
         logger.warning("Using concurrency of: %s - CONCURRENCY IS EXPERIMENTAL", concurrency)
+        workers = _ConcurrentWriteWorkers(
+            cloud_interface_generator=cloud_interface_generator,
+            storage_connector_generator=storage_connector_generator,
+        )
         with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
-            threads = []
-            for region_name in self.cloud_interface.get_enabled_regions():
-                cw = CloudWanderer(
-                    storage_connectors=storage_connector_generator(), cloud_interface=cloud_interface_generator()
-                )
-                threads.append(
-                    executor.submit(
-                        exception_logging_wrapper,
-                        method=cw.write_resources,
-                        regions=[region_name],
-                        return_value=cw.storage_connectors,
-                        **kwargs,
-                    )
+            list(
+                executor.map(
+                    functools.partial(_write_region_resources, workers, **kwargs),
+                    self.cloud_interface.get_enabled_regions(),
                 )
-        thread_results: List[CloudWandererConcurrentWriteThreadResult] = []
-        for thread in threads:
-            result = thread.result()
-            if result:
-                thread_results.append(CloudWandererConcurrentWriteThreadResult(storage_connectors=result))
-        return thread_results
+            )
+        return [
+            CloudWandererConcurrentWriteThreadResult(storage_connectors=cw.storage_connectors)
+            for cw in workers.cloud_wanderers
+        ]
 
     def _write_resource(self, resource: CloudWandererResource) -> Union[URN, PartialUrn]:
         for storage_connector in self.storage_connectors:
             storage_connector.write_resource(resource)
         return resource.urn
 
+    def _write_resources(self, resources: List[CloudWandererResource]) -> None:
+        if not resources:
+            return
+        for storage_connector in self.storage_connectors:
+            storage_connector.write_resources(resources)
+
+
+class _ConcurrentWriteWorkers:
+    """The CloudWanderer each worker thread of write_resources_concurrently writes with."""
+
+    def __init__(self, cloud_interface_generator: Callable, storage_connector_generator: Callable) -> None:
+        self.cloud_wanderers: List[CloudWanderer] = []
+        self._cloud_interface_generator = cloud_interface_generator
+        self._storage_connector_generator = storage_connector_generator
+        self._thread_state = threading.local()
+        self._lock = threading.Lock()
+
+    def get_cloud_wanderer(self) -> CloudWanderer:
+        """Return this thread's CloudWanderer, creating it from the generators the first time."""
+        cloud_wanderer = getattr(self._thread_state, "cloud_wanderer", None)
+        if cloud_wanderer is None:
+            cloud_wanderer = CloudWanderer(
+                storage_connectors=self._storage_connector_generator(),
+                cloud_interface=self._cloud_interface_generator(),
+            )
+            self._thread_state.cloud_wanderer = cloud_wanderer
+            with self._lock:
+                self.cloud_wanderers.append(cloud_wanderer)
+        return cloud_wanderer
+
+
+def _write_region_resources(workers: _ConcurrentWriteWorkers, region_name: str, **kwargs) -> None:
+    # The regions are already spread across the worker threads, so fetch within a region one at a time
+    # to keep the total number of threads at ``concurrency`` and each worker's cloud interface to itself.
+    exception_logging_wrapper(
+        method=workers.get_cloud_wanderer().write_resources, regions=[region_name], concurrency=1, **kwargs
+    )
+
+
+class _ResourceQueue:
+    """A bounded queue of resources fetched on one thread and written to storage on another."""
+
+    def __init__(self, maxsize: int, cancelled: threading.Event) -> None:
+        self._queue: "queue.Queue[Optional[CloudWandererResource]]" = queue.Queue(maxsize=maxsize)
+        self._cancelled = cancelled
+
+    @property
+    def cancelled(self) -> bool:
+        """Return whether the write these resources are for was cancelled."""
+        return self._cancelled.is_set()
+
+    def put(self, resource: Optional[CloudWandererResource]) -> bool:
+        """Wait for space in the queue and add the resource to it, ``None`` marks the end of the resources.
+
+        Returns ``False`` without adding the resource if the write was cancelled while waiting.
+
+        Arguments:
+            resource: The resource to add.
+        """
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(resource, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def batches(self, batch_size: int) -> Iterator[List[CloudWandererResource]]:
+        """Yield lists of up to ``batch_size`` resources as they arrive until the end of the resources.
+
+        Arguments:
+            batch_size: The maximum number of resources in each batch.
+        """
+        batch: List[CloudWandererResource] = []
+        while True:
+            resource = self._queue.get()
+            if resource is None:
+                break
+            batch.append(resource)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
 
 class CloudWandererConcurrentWriteThreadResult(NamedTuple):
     """The result from write_resources_concurrently."""
 
-    storage_connectors: BaseStorageConnector
+    storage_connectors: List[BaseStorageConnector]
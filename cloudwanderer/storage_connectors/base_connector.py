@@ -1,7 +1,7 @@
 """Module containing abstract classes for CloudWanderer storage connectors."""
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 
 from ..cloud_wanderer_resource import CloudWandererResource
 from ..urn import URN
@@ -32,6 +32,18 @@ class BaseStorageConnector(ABC):
             resource (CloudWandererResource): The CloudWandererResource to write.
         """
 
+    def write_resources(self, resources: Iterable[CloudWandererResource]) -> None:
+        """Persist a batch of resources to storage.
+
+        Connectors whose backends support bulk writes should override this,
+        by default it calls :meth:`write_resource` for each resource.
+
+        Arguments:
+            resources: The CloudWandererResources to write.
+        """
+        for resource in resources:
+            self.write_resource(resource)
+
     @abstractmethod
     def read_all(self) -> Iterator[dict]:
         """Return all records from storage."""
@@ -18,6 +18,7 @@ else:
 
 import boto3
 from boto3.dynamodb.conditions import Attr, ConditionBase, Key
+from boto3.dynamodb.table import BatchWriter
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb import DynamoDBServiceResource
@@ -41,6 +42,8 @@ class DynamoDBQueryArgs(TypedDict, total=False):
     KeyConditionExpression: Optional[Union[str, ConditionBase]]
     FilterExpression: Optional[Union[str, ConditionBase]]
     IndexName: Optional[str]
+    ProjectionExpression: str
+    ExpressionAttributeNames: Dict[str, str]
 
 
 def _gen_resource_type_index(service: str, resource_type: str) -> str:
@@ -196,6 +199,7 @@ class DynamoDbConnector(BaseStorageConnector):
         self.number_of_shards = number_of_shards
         self.dynamodb: DynamoDBServiceResource = self.boto3_session.resource("dynamodb", **self.client_args)
         self.dynamodb_table = self.dynamodb.Table(table_name)
+        self._batch_writer: Optional[BatchWriter] = None
 
     def init(self) -> None:
         """Create the DynamoDB Database."""
@@ -204,6 +208,32 @@ class DynamoDbConnector(BaseStorageConnector):
 
     def write_resource(self, resource: CloudWandererResource) -> None:
         logger.debug(f"Writing: {resource.urn} to {self.table_name}")
+        if self._batch_writer is not None:
+            self._batch_writer.put_item(Item=self._resource_to_item(resource))
+            return
+        self.dynamodb_table.put_item(Item=self._resource_to_item(resource))
+
+    def write_resources(self, resources: Iterable[CloudWandererResource]) -> None:
+        """Persist a batch of resources to DynamoDB using BatchWriteItem.
+
+        The batch writer flushes every 25 items and resubmits any unprocessed items.
+        If the connector is open the resources are added to its batch writer and
+        any partial batch is sent with the next one or when the connector is closed.
+
+        Arguments:
+            resources: The CloudWandererResources to write.
+        """
+        if self._batch_writer is not None:
+            for resource in resources:
+                logger.debug(f"Writing: {resource.urn} to {self.table_name}")
+                self._batch_writer.put_item(Item=self._resource_to_item(resource))
+            return
+        with self.dynamodb_table.batch_writer(overwrite_by_pkeys=["_id", "_attr"]) as batch:
+            for resource in resources:
+                logger.debug(f"Writing: {resource.urn} to {self.table_name}")
+                batch.put_item(Item=self._resource_to_item(resource))
+
+    def _resource_to_item(self, resource: CloudWandererResource) -> Dict[str, Any]:
         if resource.urn.is_partial:
             raise ValueError("Expected complete urn got partial for resource URN: %s.", resource.urn)
         item = {
@@ -216,7 +246,7 @@ class DynamoDbConnector(BaseStorageConnector):
         }
         if resource.is_dependent_resource:
             item["_parent_urn"] = str(resource.parent_urn)
-        self.dynamodb_table.put_item(Item=item)
+        return item
 
     def _generate_urn_index_values(self, urn: URN, attr: str = "BaseResource") -> Dict[str, Any]:
         values = {
@@ -244,6 +274,7 @@ class DynamoDbConnector(BaseStorageConnector):
         Arguments:
             urn (URN): The AWS URN of the resource to return
         """
+        self._flush_writes()
         result = self._paginated_query(
             DynamoDBQueryArgs(KeyConditionExpression=Key("_id").eq(_primary_key_from_urn(urn)))
         )
@@ -258,6 +289,7 @@ class DynamoDbConnector(BaseStorageConnector):
         resource_type: str = None,
         urn: URN = None,
     ) -> Iterator["CloudWandererResource"]:
+        self._flush_writes()
         query_generator = DynamoDbQueryGenerator(cloud_name, account_id, region, service, resource_type, urn)
         for condition_expression in query_generator.condition_expressions:
             query_args = DynamoDBQueryArgs(
@@ -278,6 +310,7 @@ class DynamoDbConnector(BaseStorageConnector):
 
     def read_all(self) -> Iterator[dict]:
         """Return raw data from all DynamoDB table records (not just resources)."""
+        self._flush_writes()
         paginator = self.dynamodb_table.meta.client.get_paginator("scan")
         yield from (item for page in paginator.paginate(TableName=self.dynamodb_table.name) for item in page["Items"])
 
@@ -287,16 +320,26 @@ class DynamoDbConnector(BaseStorageConnector):
         Arguments:
             urn (URN): The URN of the resource to delete from Dynamo
         """
+        self._flush_writes()
+        with self.dynamodb_table.batch_writer(overwrite_by_pkeys=["_id", "_attr"]) as batch:
+            self._delete_resource_records(urn=urn, batch=batch)
+
+    def _delete_resource_records(self, urn: URN, batch: BatchWriter) -> None:
+        """Queue the deletion of the resource's records and its dependent resources' records.
+
+        Arguments:
+            urn (URN): The URN of the resource to delete from Dynamo
+            batch: The DynamoDB table batch writer to queue the deletions on.
+        """
         resource_records = itertools.chain(
             self._paginated_query(DynamoDBQueryArgs(KeyConditionExpression=Key("_id").eq(_primary_key_from_urn(urn)))),
             self._paginated_query(
                 DynamoDBQueryArgs(IndexName="parent_urn", KeyConditionExpression=Key("_parent_urn").eq(str(urn)))
             ),
         )
-        with self.dynamodb_table.batch_writer() as batch:
-            for record in resource_records:
-                logger.info("Deleting %s", record["_id"])
-                batch.delete_item(Key={"_id": record["_id"], "_attr": record["_attr"]})
+        for record in resource_records:
+            logger.info("Deleting %s", record["_id"])
+            batch.delete_item(Key={"_id": record["_id"], "_attr": record["_attr"]})
 
     def delete_resource_of_type_in_account_region(
         self,
@@ -308,25 +351,50 @@ class DynamoDbConnector(BaseStorageConnector):
         cutoff: Optional[datetime.datetime],
     ) -> None:
         logger.debug("Deleting any %s discovered before %s", resource_type, cutoff)
-        resource_records = self.read_resources(
-            cloud_name=cloud_name, service=service, resource_type=resource_type, account_id=account_id, region=region
+        self._flush_writes()
+        query_generator = DynamoDbQueryGenerator(
+            cloud_name=cloud_name, account_id=account_id, region=region, service=service, resource_type=resource_type
         )
-        for resource in resource_records:
-            if cutoff and resource.discovery_time >= cutoff:
-                logger.debug("Skipping deletion of %s as it was discovered after our cutoff.", resource.urn)
-                continue
-            if resource.urn.is_partial:
-                raise NotImplementedError(
-                    "The DynamoDB Storage connector does not know how to delete partial URNs: %s.", resource.urn
+        with self.dynamodb_table.batch_writer(overwrite_by_pkeys=["_id", "_attr"]) as batch:
+            for condition_expression in query_generator.condition_expressions:
+                query_args = DynamoDBQueryArgs(
+                    KeyConditionExpression=condition_expression,
+                    FilterExpression=query_generator.filter_expression,
+                    ProjectionExpression="#id, #discovery_time",
+                    ExpressionAttributeNames={"#id": "_id", "#discovery_time": "_discovery_time"},
                 )
-            logger.debug("Cleaning up %s discovered %s", str(resource.urn), resource.discovery_time)
-            self.delete_resource(urn=cast(URN, resource.urn))
+                if query_generator.index is not None:
+                    query_args["IndexName"] = query_generator.index
+                for record in self._paginated_query(query_args):
+                    urn = _urn_from_primary_key(record["_id"])
+                    discovery_time = datetime.datetime.strptime(record["_discovery_time"], ISO_DATE_FORMAT)
+                    if cutoff and discovery_time >= cutoff:
+                        logger.debug("Skipping deletion of %s as it was discovered after our cutoff.", urn)
+                        continue
+                    if urn.is_partial:
+                        raise NotImplementedError(
+                            "The DynamoDB Storage connector does not know how to delete partial URNs: %s.", urn
+                        )
+                    logger.debug("Cleaning up %s discovered %s", str(urn), discovery_time)
+                    self._delete_resource_records(urn=urn, batch=batch)
 
     def open(self) -> None:
-        ...
+        """Hold a batch writer open so that writes are sent in batches until the connector is closed."""
+        if self._batch_writer is None:
+            self._batch_writer = self.dynamodb_table.batch_writer(overwrite_by_pkeys=["_id", "_attr"])
 
     def close(self) -> None:
-        ...
+        """Send any writes still buffered in the batch writer."""
+        self._flush_writes()
+        self._batch_writer = None
+
+    def _flush_writes(self) -> None:
+        """Send any buffered writes so that reads and deletes see them."""
+        if self._batch_writer is None:
+            return
+        # Leaving the batch writer's context sends its whole buffer, it can keep buffering afterwards.
+        with self._batch_writer:
+            pass
 
     def _gen_shard(self, key: str, shard_id: int = None) -> str:
         """Append a shard designation to the end of a supplied key.
@@ -88,12 +88,10 @@ class MemoryStorageConnector(BaseStorageConnector):
                 }
 
     def write_resource(self, resource: CloudWandererResource) -> None:
-        self._data[str(resource.urn)] = self._data.get(str(resource.urn), {})
-        self._data[str(resource.urn)]["BaseResource"] = standardise_data_types(
-            resource.cloudwanderer_metadata.resource_data
-        )
-        self._data[str(resource.urn)]["ParentUrn"] = resource.parent_urn
-        self._data[str(resource.urn)]["DependentResourceUrns"] = resource.dependent_resource_urns
+        record = self._data.setdefault(str(resource.urn), {})
+        record["BaseResource"] = standardise_data_types(resource.cloudwanderer_metadata.resource_data)
+        record["ParentUrn"] = resource.parent_urn
+        record["DependentResourceUrns"] = resource.dependent_resource_urns
 
     def delete_resource(self, urn: URN) -> None:
         try:
@@ -129,12 +127,11 @@ class MemoryStorageConnector(BaseStorageConnector):
                 continue
             if urn.region != region:
                 continue
-            resource = memory_item_to_resource(urn, items)
-            if cutoff and resource.discovery_time >= cutoff:
+            if cutoff and memory_item_to_resource(urn, items).discovery_time >= cutoff:
                 continue
-            urns_to_delete.append(urn)
-        for urn in urns_to_delete:
-            del self._data[str(urn)]
+            urns_to_delete.append(urn_str)
+        for urn_str in urns_to_delete:
+            del self._data[urn_str]
 
     def __repr__(self) -> str:
         """Return an instantiable string representation of this object."""
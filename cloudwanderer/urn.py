@@ -17,6 +17,7 @@ Example:
 service='iam', resource_type='vpc', resource_id_parts=['vpc-11111111'])
 
 """
+import functools
 import re
 from typing import Any, Generator, List, Optional, Tuple
 
@@ -161,6 +162,10 @@ class PartialUrn:
         """
         return str(self) == str(other)
 
+    def __hash__(self) -> int:
+        """Allow URNs to be used in sets and as dictionary keys."""
+        return hash(str(self))
+
     def __iter__(self) -> Generator[Tuple[str, str], None, None]:
         """Allow the URN to be turned into a dict."""
         for attribute_name in vars(self):
@@ -234,9 +239,8 @@ class URN(PartialUrn):
         Raises:
             ValueError: When no valid resource id found
         """
-        parts = re.split(r"(?<!\\):", urn_string)
         try:
-            resource_id_parts = re.split(r"(?<!\\)/", parts[6])
+            parts, resource_id_parts = _split_urn_string(urn_string)
         except IndexError:
             raise ValueError("Resource ID must be supplied as the 7th element in a colon separated string")
         return cls(
@@ -244,5 +248,19 @@ class URN(PartialUrn):
             region=parts[3],
             service=parts[4],
             resource_type=parts[5],
-            resource_id_parts=[cls.unescape_id(id_part) for id_part in resource_id_parts],
+            resource_id_parts=list(resource_id_parts),
         )
+
+
+@functools.lru_cache(maxsize=200_000)
+def _split_urn_string(urn_string: str) -> Tuple[Tuple[str, ...], Tuple[Optional[str], ...]]:
+    """Return the colon separated parts of an URN string and its unescaped resource id parts.
+
+    Cached as the same URN strings are parsed repeatedly when reading and cleaning up storage.
+
+    Arguments:
+        urn_string: The string version of an URN to split.
+    """
+    parts = re.split(r"(?<!\\):", urn_string)
+    resource_id_parts = re.split(r"(?<!\\)/", parts[6])
+    return tuple(parts), tuple(PartialUrn.unescape_id(id_part) for id_part in resource_id_parts)
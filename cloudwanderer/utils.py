@@ -1,4 +1,5 @@
 """Collection of loose utility functions."""
+import functools
 import json
 import logging
 from datetime import datetime
@@ -63,6 +64,7 @@ def standardise_data_types(resource: dict) -> Dict[str, Any]:
     return result
 
 
+@functools.lru_cache(maxsize=512)
 def snake_to_pascal(snake_case: str) -> str:
     """Return a PascalCase version of a snake_case name.
 
@@ -1,10 +1,12 @@
 import datetime
+import threading
 from unittest.mock import ANY, MagicMock
 
-from pytest import fixture
+from pytest import fixture, raises
 
 from cloudwanderer import CloudWanderer
 from cloudwanderer.aws_interface.interface import CloudWandererAWSInterface
+from cloudwanderer.cloud_wanderer import _ResourceQueue
 from cloudwanderer.cloud_wanderer_resource import CloudWandererResource
 from cloudwanderer.models import ActionSet, ServiceResourceType
 from cloudwanderer.urn import URN, PartialUrn
@@ -66,19 +68,21 @@ def test_write_resources(cloud_wanderer: CloudWanderer):
     cloud_wanderer.cloud_interface.get_resources.assert_called_with(
         region="eu-west-1", service_name="ec2", resource_type="vpc", service_resource_type_filters=ANY
     )
-    cloud_wanderer.storage_connectors[0].write_resource.assert_called_with(
-        CloudWandererResource(
-            urn=URN(
-                cloud_name="aws",
-                account_id="111111111111",
-                region="eu-west-1",
-                service="ec2",
-                resource_type="vpc",
-                resource_id_parts=["vpc-11111111"],
-            ),
-            dependent_resource_urns=[],
-            resource_data={},
-        )
+    cloud_wanderer.storage_connectors[0].write_resources.assert_called_with(
+        [
+            CloudWandererResource(
+                urn=URN(
+                    cloud_name="aws",
+                    account_id="111111111111",
+                    region="eu-west-1",
+                    service="ec2",
+                    resource_type="vpc",
+                    resource_id_parts=["vpc-11111111"],
+                ),
+                dependent_resource_urns=[],
+                resource_data={},
+            )
+        ]
     )
     cloud_wanderer.storage_connectors[0].delete_resource_of_type_in_account_region.assert_called_with(
         cloud_name="aws",
@@ -97,19 +101,21 @@ def test_get_resources_specific_resource(cloud_wanderer: CloudWanderer):
     cloud_wanderer.cloud_interface.get_resources.assert_called_with(
         region="eu-west-1", service_name="ec2", resource_type="vpc", service_resource_type_filters=ANY
     )
-    cloud_wanderer.storage_connectors[0].write_resource.assert_called_with(
-        CloudWandererResource(
-            urn=URN(
-                cloud_name="aws",
-                account_id="111111111111",
-                region="eu-west-1",
-                service="ec2",
-                resource_type="vpc",
-                resource_id_parts=["vpc-11111111"],
-            ),
-            dependent_resource_urns=[],
-            resource_data={},
-        )
+    cloud_wanderer.storage_connectors[0].write_resources.assert_called_with(
+        [
+            CloudWandererResource(
+                urn=URN(
+                    cloud_name="aws",
+                    account_id="111111111111",
+                    region="eu-west-1",
+                    service="ec2",
+                    resource_type="vpc",
+                    resource_id_parts=["vpc-11111111"],
+                ),
+                dependent_resource_urns=[],
+                resource_data={},
+            )
+        ]
     )
     cloud_wanderer.storage_connectors[0].delete_resource_of_type_in_account_region.assert_called_with(
         cloud_name="aws",
@@ -119,3 +125,84 @@ def test_get_resources_specific_resource(cloud_wanderer: CloudWanderer):
         resource_type="vpc",
         cutoff=datetime.datetime(1986, 1, 1, 0, 0, tzinfo=datetime.timezone.utc),
     )
+
+
+def test_write_resources_raises_get_resources_exceptions(cloud_wanderer: CloudWanderer):
+    cloud_wanderer.cloud_interface.get_resources.side_effect = ValueError("Enumeration failed")
+
+    with raises(ValueError, match="Enumeration failed"):
+        cloud_wanderer.write_resources(concurrency=2)
+
+    cloud_wanderer.storage_connectors[0].write_resources.assert_not_called()
+
+
+def test_write_resources_fetches_action_sets_concurrently(cloud_wanderer: CloudWanderer):
+    action_set = cloud_wanderer.cloud_interface.get_resource_discovery_actions.return_value[0]
+    cloud_wanderer.cloud_interface.get_resource_discovery_actions.return_value = [action_set, action_set]
+    # Both fetches must be in flight at the same time for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_resources(**kwargs):
+        barrier.wait()
+        return []
+
+    cloud_wanderer.cloud_interface.get_resources.side_effect = get_resources
+
+    cloud_wanderer.write_resources(concurrency=2)
+
+    assert cloud_wanderer.cloud_interface.get_resources.call_count == 2
+    assert cloud_wanderer.storage_connectors[0].delete_resource_of_type_in_account_region.call_count == 2
+
+
+def test_write_resources_writes_in_batches(cloud_wanderer: CloudWanderer):
+    resource = cloud_wanderer.cloud_interface.get_resources.return_value[0]
+    cloud_wanderer.cloud_interface.get_resources.return_value = [resource] * 30
+
+    cloud_wanderer.write_resources()
+
+    assert [len(call[0][0]) for call in cloud_wanderer.storage_connectors[0].write_resources.call_args_list] == [
+        25,
+        5,
+    ]
+
+
+def test_write_resources_stops_fetching_when_writing_fails(cloud_wanderer: CloudWanderer):
+    resource = cloud_wanderer.cloud_interface.get_resources.return_value[0]
+    # Far more resources than fit in the queue, so the fetch would block forever if it were not stopped.
+    cloud_wanderer.cloud_interface.get_resources.return_value = (resource for _ in range(100_000))
+    cloud_wanderer.storage_connectors[0].write_resources.side_effect = ValueError("Write failed")
+
+    with raises(ValueError, match="Write failed"):
+        cloud_wanderer.write_resources()
+
+
+def test_write_resources_closes_connectors_when_writing_fails(cloud_wanderer: CloudWanderer):
+    cloud_wanderer.storage_connectors[0].write_resources.side_effect = ValueError("Write failed")
+
+    with raises(ValueError, match="Write failed"):
+        cloud_wanderer.write_resources()
+
+    cloud_wanderer.storage_connectors[0].close.assert_called_once()
+
+
+def test_write_resource_closes_connectors_when_fetching_fails(cloud_wanderer: CloudWanderer):
+    cloud_wanderer.cloud_interface.get_resource.side_effect = ValueError("Fetch failed")
+
+    with raises(ValueError, match="Fetch failed"):
+        cloud_wanderer.write_resource(urn=URN.from_string("urn:aws:111111111111:eu-west-1:ec2:vpc:vpc-11111111"))
+
+    cloud_wanderer.storage_connectors[0].close.assert_called_once()
+
+
+def test_get_resources_skipped_once_cancelled(cloud_wanderer: CloudWanderer):
+    cancelled = threading.Event()
+    cancelled.set()
+    action_set = cloud_wanderer.cloud_interface.get_resource_discovery_actions.return_value[0]
+
+    cloud_wanderer._get_resources(
+        get_urn=action_set.get_urns[0],
+        service_resource_type_filters=[],
+        resource_queue=_ResourceQueue(maxsize=1, cancelled=cancelled),
+    )
+
+    cloud_wanderer.cloud_interface.get_resources.assert_not_called()
@@ -1,4 +1,5 @@
-from unittest.mock import ANY
+import threading
+from unittest.mock import ANY, MagicMock
 
 from boto3.resources.base import ServiceResource
 from moto import mock_ec2, mock_iam, mock_s3, mock_sts
@@ -161,6 +162,26 @@ def test_secondary_attribute_names(ec2_service):
     assert get_single_ec2_vpc(ec2_service).secondary_attribute_names == ["vpc_enable_dns_support"]
 
 
+@mock_ec2
+@mock_sts
+def test_fetch_secondary_attributes_loads_concurrently(ec2_service):
+    # Both loads must be in flight at the same time for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+    secondary_attribute_resources = [MagicMock(**{"load.side_effect": lambda: barrier.wait()}) for _ in range(2)]
+    vpc = MagicMock(
+        secondary_attribute_names=["vpc_enable_dns_support", "vpc_enable_dns_hostnames"],
+        **{
+            "VpcEnableDnsSupport.return_value": secondary_attribute_resources[0],
+            "VpcEnableDnsHostnames.return_value": secondary_attribute_resources[1],
+        },
+    )
+
+    type(get_single_ec2_vpc(ec2_service)).fetch_secondary_attributes(vpc)
+
+    assert vpc._secondary_attributes == secondary_attribute_resources
+    assert vpc._secondary_attributes_fetched
+
+
 @mock_iam
 @mock_sts
 def test_secondary_attribute_maps(iam_service):
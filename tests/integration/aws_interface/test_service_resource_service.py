@@ -6,6 +6,10 @@ def test_resource_types(ec2_service):
     assert {"instance", "internet_gateway", "vpc"}.issubset(set(ec2_service.resource_types))
 
 
+def test_resource_types_are_cached(ec2_service):
+    assert ec2_service.resource_types is ec2_service.resource_types
+
+
 @mock_ec2
 def test_collection_all(ec2_service):
     assert isinstance(list(ec2_service.collection("vpc").all())[0], ServiceResource)
@@ -22,3 +26,16 @@ def test_empty_resource(ec2_service):
 # def test_get_resources_filtered(ec2_service):
 #     results = self.service.get_resources("vpc", resource_filters={"MaxResults": 5})
 #     assert isinstance(next(results), CloudWandererBoto3Resource)
+
+
+def test_resource_classes_are_reused(cloudwanderer_boto3_session):
+    eu_west_2_vpc = cloudwanderer_boto3_session.resource("ec2", region_name="eu-west-2").resource(
+        "vpc", empty_resource=True
+    )
+    us_east_1_vpc = cloudwanderer_boto3_session.resource("ec2", region_name="us-east-1").resource(
+        "vpc", empty_resource=True
+    )
+
+    assert type(eu_west_2_vpc) is type(us_east_1_vpc)
+    assert eu_west_2_vpc.meta.client.meta.region_name == "eu-west-2"
+    assert us_east_1_vpc.meta.client.meta.region_name == "us-east-1"
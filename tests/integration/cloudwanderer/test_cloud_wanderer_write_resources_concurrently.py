@@ -1,7 +1,9 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from moto import mock_ec2, mock_iam, mock_s3, mock_sts
+from pytest import raises
 
+from cloudwanderer import CloudWanderer
 from cloudwanderer.storage_connectors import MemoryStorageConnector
 from cloudwanderer.urn import URN
 
@@ -49,6 +51,50 @@ def test_write_resources(cloudwanderer_aws, aws_interface, default_test_discover
     }
 
 
+@mock_sts
+@mock_ec2
+def test_write_resources_generators_called_once_per_worker(cloudwanderer_aws, aws_interface):
+    aws_interface.get_resource_discovery_actions = MagicMock(return_value=[])
+    storage_connector_generator = MagicMock(side_effect=lambda: [MemoryStorageConnector()])
+    cloud_interface_generator = MagicMock(return_value=aws_interface)
+
+    thread_results = cloudwanderer_aws.write_resources_concurrently(
+        concurrency=2,
+        cloud_interface_generator=cloud_interface_generator,
+        storage_connector_generator=storage_connector_generator,
+    )
+
+    assert len(aws_interface.get_enabled_regions()) > 2
+    assert 1 <= storage_connector_generator.call_count <= 2
+    assert cloud_interface_generator.call_count == storage_connector_generator.call_count
+    assert len(thread_results) == storage_connector_generator.call_count
+
+
+@mock_sts
+@mock_ec2
+def test_write_resources_fetches_each_region_on_one_thread(cloudwanderer_aws, aws_interface):
+    with patch.object(CloudWanderer, "write_resources") as write_resources:
+        cloudwanderer_aws.write_resources_concurrently(
+            concurrency=2,
+            cloud_interface_generator=lambda: aws_interface,
+            storage_connector_generator=lambda: [MemoryStorageConnector()],
+        )
+
+    assert write_resources.call_count == len(aws_interface.get_enabled_regions())
+    assert {call[1]["concurrency"] for call in write_resources.call_args_list} == {1}
+
+
+@mock_sts
+@mock_ec2
+def test_write_resources_raises_generator_exceptions(cloudwanderer_aws, aws_interface):
+    with raises(RuntimeError, match="bad creds"):
+        cloudwanderer_aws.write_resources_concurrently(
+            concurrency=2,
+            cloud_interface_generator=MagicMock(side_effect=RuntimeError("bad creds")),
+            storage_connector_generator=lambda: [MemoryStorageConnector()],
+        )
+
+
 # TODO: Reinstate exclude_resources
 # def test_write_resources_exclude_resources(self):
 #     thread_results = list(
@@ -1,8 +1,29 @@
+import datetime
 import unittest
 
 import boto3
+from moto import mock_dynamodb2
 
+from cloudwanderer.cloud_wanderer_resource import CloudWandererResource
 from cloudwanderer.storage_connectors import DynamoDbConnector
+from cloudwanderer.urn import URN
+
+
+def generate_vpcs(count, discovery_time=None):
+    return [
+        CloudWandererResource(
+            urn=URN(
+                account_id="111111111111",
+                region="eu-west-2",
+                service="ec2",
+                resource_type="vpc",
+                resource_id_parts=[f"vpc-{i}"],
+            ),
+            resource_data={"VpcId": f"vpc-{i}"},
+            discovery_time=discovery_time,
+        )
+        for i in range(count)
+    ]
 
 
 class TestDynamoDBConnector(unittest.TestCase):
@@ -20,3 +41,84 @@ class TestDynamoDBConnector(unittest.TestCase):
             boto3_session=boto3.Session(aws_access_key_id="1", aws_secret_access_key="1", region_name="eu-west-2")
         )
         assert str(connector) == "<DynamoDbConnector=cloud_wanderer>"
+
+    @mock_dynamodb2
+    def test_write_resources(self):
+        connector = DynamoDbConnector(
+            boto3_session=boto3.Session(aws_access_key_id="1", aws_secret_access_key="1", region_name="eu-west-2")
+        )
+        connector.init()
+        resources = generate_vpcs(30)
+
+        connector.write_resources(resources)
+
+        assert sorted(
+            str(resource.urn) for resource in connector.read_resources(service="ec2", resource_type="vpc")
+        ) == sorted(str(resource.urn) for resource in resources)
+        assert connector.read_resource(resources[-1].urn).vpc_id == "vpc-29"
+
+    @mock_dynamodb2
+    def test_delete_resource_of_type_in_account_region(self):
+        connector = DynamoDbConnector(
+            boto3_session=boto3.Session(aws_access_key_id="1", aws_secret_access_key="1", region_name="eu-west-2")
+        )
+        connector.init()
+        cutoff = datetime.datetime(2021, 1, 1, 0, 0, 0, 1)
+        stale_resources = generate_vpcs(30, discovery_time=datetime.datetime(2020, 1, 1, 0, 0, 0, 1))
+        current_resource = CloudWandererResource(
+            urn=URN(
+                account_id="111111111111",
+                region="eu-west-2",
+                service="ec2",
+                resource_type="vpc",
+                resource_id_parts=["vpc-current"],
+            ),
+            resource_data={},
+            discovery_time=cutoff,
+        )
+        connector.write_resources(stale_resources + [current_resource])
+
+        connector.delete_resource_of_type_in_account_region(
+            cloud_name="aws",
+            service="ec2",
+            resource_type="vpc",
+            account_id="111111111111",
+            region="eu-west-2",
+            cutoff=cutoff,
+        )
+
+        assert [str(resource.urn) for resource in connector.read_resources(service="ec2", resource_type="vpc")] == [
+            str(current_resource.urn)
+        ]
+
+    @mock_dynamodb2
+    def test_open_buffers_writes_until_close(self):
+        connector = DynamoDbConnector(
+            boto3_session=boto3.Session(aws_access_key_id="1", aws_secret_access_key="1", region_name="eu-west-2")
+        )
+        connector.init()
+        resources = generate_vpcs(3)
+
+        connector.open()
+        for resource in resources:
+            connector.write_resource(resource)
+
+        assert connector.dynamodb_table.scan()["Count"] == 0
+        connector.close()
+        assert sorted(
+            str(resource.urn) for resource in connector.read_resources(service="ec2", resource_type="vpc")
+        ) == sorted(str(resource.urn) for resource in resources)
+
+    @mock_dynamodb2
+    def test_open_flushes_writes_before_reads(self):
+        connector = DynamoDbConnector(
+            boto3_session=boto3.Session(aws_access_key_id="1", aws_secret_access_key="1", region_name="eu-west-2")
+        )
+        connector.init()
+        resources = generate_vpcs(3)
+
+        connector.open()
+        connector.write_resources(resources)
+
+        assert connector.read_resource(resources[0].urn).vpc_id == "vpc-0"
+        connector.close()
@@ -184,3 +184,15 @@ class TestURN(unittest.TestCase):
             "resource_type": "role",
             "service": "iam",
         }
+
+    def test_hash(self):
+        assert {self.test_urn_resource, self.test_urn_dependent_resource} == {
+            URN.from_string("urn:aws:111111111111:us-east-1:iam:role:test-role"),
+            URN.from_string("urn:aws:111111111111:us-east-1:iam:role_policy:test-role/test-policy"),
+        }
+
+    def test_from_string_returns_new_objects(self):
+        urn = URN.from_string("urn:aws:111111111111:us-east-1:iam:role:test-role")
+        urn.resource_id_parts.append("mutated")
+
+        assert URN.from_string("urn:aws:111111111111:us-east-1:iam:role:test-role").resource_id_parts == ["test-role"]
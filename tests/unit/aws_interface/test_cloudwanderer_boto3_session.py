@@ -65,3 +65,14 @@ def test_get_enabled_regions_from_arg():
     assert subject.get_enabled_regions() == ["eu-west-1"]
 
     botocore_session.create_client.assert_not_called()
+
+
+def test_get_available_resources_is_cached():
+    botocore_session = MagicMock()
+    subject = CloudWandererBoto3Session(botocore_session=botocore_session)
+    subject._loader = MagicMock(**{"list_available_services.return_value": ["ec2"]})
+
+    assert subject.get_available_resources() == ["ec2"]
+    assert subject.get_available_resources() == ["ec2"]
+
+    subject._loader.list_available_services.assert_called_once_with(type_name="resources-1")
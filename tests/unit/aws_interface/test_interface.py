@@ -1,5 +1,10 @@
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
+from botocore.config import Config
+
 from cloudwanderer.aws_interface import CloudWandererAWSInterface
 
 
@@ -21,3 +26,85 @@ def test_get_resources_requires_load():
     list(interface.get_resources(service_name="test_service", resource_type="test_resource", region="test-region"))
 
     mock_resource.load.assert_called()
+
+
+def test_get_service_reused_per_thread():
+    mock_session = MagicMock()
+    mock_session.resource.side_effect = lambda **kwargs: MagicMock()
+    interface = CloudWandererAWSInterface(cloudwanderer_boto3_session=mock_session)
+
+    first_service = interface._get_service(service_name="ec2", region_name="eu-west-1")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_service = executor.submit(interface._get_service, service_name="ec2", region_name="eu-west-1")
+
+    assert interface._get_service(service_name="ec2", region_name="eu-west-1") is first_service
+    assert interface._get_service(service_name="ec2", region_name="us-east-1") is not first_service
+    assert other_thread_service.result() is not first_service
+    assert mock_session.resource.call_count == 3
+
+
+def test_get_service_released_when_thread_exits():
+    mock_session = MagicMock()
+    mock_session.resource.side_effect = lambda **kwargs: MagicMock()
+    interface = CloudWandererAWSInterface(cloudwanderer_boto3_session=mock_session)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        service_ref = executor.submit(
+            lambda: weakref.ref(interface._get_service(service_name="ec2", region_name="eu-west-1"))
+        ).result()
+    gc.collect()
+
+    assert service_ref() is None
+
+
+def test_get_resources_gets_parent_urn_once():
+    mock_session = MagicMock()
+    mock_service = mock_session.resource.return_value
+    mock_resource = MagicMock(dependent_resource_types=["test_dependent_resource"])
+    mock_resource.resource_map.requires_load = False
+    mock_resource.collection.return_value = [MagicMock(), MagicMock()]
+    mock_service.collection.return_value = [mock_resource]
+
+    interface = CloudWandererAWSInterface(cloudwanderer_boto3_session=mock_session)
+
+    resources = list(
+        interface.get_resources(service_name="test_service", resource_type="test_resource", region="test-region")
+    )
+
+    assert len(resources) == 3
+    assert all(resource.parent_urn == mock_resource.get_urn.return_value for resource in resources[:2])
+    mock_resource.get_urn.assert_called_once()
+
+
+def test_get_service_unhashable_client_args():
+    mock_session = MagicMock()
+    interface = CloudWandererAWSInterface(cloudwanderer_boto3_session=mock_session)
+
+    service = interface._get_service(service_name="ec2", region_name="eu-west-1", client_args={"unhashable": {}})
+
+    assert service == mock_session.resource.return_value
+    mock_session.resource.assert_called_with(
+        service_name="ec2", region_name="eu-west-1", unhashable={}, config=interface.botocore_config
+    )
+
+
+def test_get_service_default_botocore_config():
+    interface = CloudWandererAWSInterface(cloudwanderer_boto3_session=MagicMock())
+
+    interface._get_service(service_name="ec2", region_name="eu-west-1")
+
+    config = interface.cloudwanderer_boto3_session.resource.call_args[1]["config"]
+    assert config.max_pool_connections == 50
+    assert config.retries == {"mode": "adaptive", "max_attempts": 10}
+
+
+def test_get_service_merges_client_args_config():
+    interface = CloudWandererAWSInterface(cloudwanderer_boto3_session=MagicMock())
+
+    interface._get_service(
+        service_name="ec2", region_name="eu-west-1", client_args={"config": Config(max_pool_connections=5)}
+    )
+
+    config = interface.cloudwanderer_boto3_session.resource.call_args[1]["config"]
+    assert config.max_pool_connections == 5
+    assert config.retries == {"mode": "adaptive", "max_attempts": 10}